@@ -1,44 +1,125 @@
 #!/home/sebas/miniforge3/envs/lerobot/bin/python
 import os
-import lerobot
-from huggingface_hub import HfApi
+import glob
 import json
 import sys
-import serial.tools.list_ports
 import time
+import shutil
 import subprocess
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CONFIG_FILE = "config.json"
 ENV_FILE = ".env"
+DATASETS_CACHE_DIR = os.path.expanduser("~/.cache/huggingface/lerobot/lehungry-robotum/")
+
+# lerobot entry points, resolved once instead of searching PATH on every launch
+TOOLS = {name: shutil.which(name) for name in ("lerobot-calibrate", "lerobot-teleoperate", "lerobot-record")}
+
+def resolve_cmd(cmd):
+    """Swaps the tool name in cmd for its resolved path, if it was found."""
+    return [TOOLS.get(cmd[0]) or cmd[0]] + cmd[1:]
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _json_dumps(obj):
+    # orjson only supports 2-space indentation, so the stdlib fallback matches it
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
 
 def load_config():
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                return json.load(f)
+            with open(CONFIG_FILE, 'rb') as f:
+                return _json_loads(f.read())
         except json.JSONDecodeError:
             return {}
     return {}
 
+def _write_file(path, data):
+    # Leave the file alone if nothing changed
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return
+    except FileNotFoundError:
+        pass
+
+    # Write to a sibling temp file then swap it in, so readers never see a partial file.
+    # Swap the symlink target rather than the link, and keep the existing permissions
+    # (.env may be chmod 600 since it can hold API keys)
+    path = os.path.realpath(path)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    if os.path.exists(path):
+        shutil.copymode(path, tmp_path)
+    os.replace(tmp_path, path)
+
 def save_config(config):
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=4)
-    
-    with open(ENV_FILE, 'w') as f:
-        for key, value in config.items():
-            if key == "leader_port":
-                f.write(f'LEADER_PORT="{value}"\n')
-                f.write(f'TELEOP_PORT="{value}"\n')
-            elif key == "follower_port":
-                f.write(f'FOLLOWER_PORT="{value}"\n')
-                f.write(f'ROBOT_PORT="{value}"\n')
-            else:
-                f.write(f'{key.upper()}="{value}"\n')
+    _write_file(CONFIG_FILE, _json_dumps(config))
+
+    lines = []
+    for key, value in config.items():
+        if key == "leader_port":
+            lines.append(f'LEADER_PORT="{value}"')
+            lines.append(f'TELEOP_PORT="{value}"')
+        elif key == "follower_port":
+            lines.append(f'FOLLOWER_PORT="{value}"')
+            lines.append(f'ROBOT_PORT="{value}"')
+        else:
+            lines.append(f'{key.upper()}="{value}"')
+    _write_file(ENV_FILE, ("\n".join(lines) + "\n").encode())
+
+def list_local_datasets(base_cache_dir=DATASETS_CACHE_DIR):
+    """Returns the sorted names of dataset directories in the local lerobot cache."""
+    try:
+        # scandir entries carry the file type, so no extra stat per name
+        with os.scandir(base_cache_dir) as entries:
+            return sorted(e.name for e in entries if e.is_dir())
+    except FileNotFoundError:
+        return []
 
 def get_current_ports_set():
     """Returns a set of device paths (e.g., {'/dev/ttyACM0', ...})"""
+    if sys.platform.startswith("linux"):
+        # The arms show up as CDC-ACM / USB-serial nodes; globbing /dev is much
+        # cheaper than pyserial walking sysfs for metadata we never read
+        return set(glob.glob("/dev/ttyACM*")) | set(glob.glob("/dev/ttyUSB*"))
+
+    # Other platforms name ports differently (COMx, /dev/cu.*), so ask pyserial
+    try:
+        import serial.tools.list_ports
+    except ImportError:
+        print("Error: pyserial is required to list ports on this platform.")
+        return set()
     return set(p.device for p in serial.tools.list_ports.comports())
 
+def wait_for_port_removal(initial_ports, timeout=30.0, interval=0.1):
+    """Polls until a port from initial_ports disappears; returns the new set, or None on timeout."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(interval)
+        current = get_current_ports_set()
+        # Ports appearing or re-enumerating meanwhile don't count
+        if initial_ports - current:
+            return current
+    return None
+
+def _drain_stdin():
+    """Discards keypresses typed while we weren't prompting."""
+    try:
+        import termios
+        if sys.stdin.isatty():
+            termios.tcflush(sys.stdin, termios.TCIFLUSH)
+    except (ImportError, OSError):
+        pass
+
 def run_clean_find_port():
     print("\n--- Find Port (Clean Mode) ---")
     print("1. Ensure your device is currently PLUGGED IN.")
@@ -47,9 +128,17 @@ def run_clean_find_port():
     initial_ports = get_current_ports_set()
     
     print("\n2. UNPLUG the USB cable now.")
-    input("   Press Enter when unplugged...")
-    
-    after_unplug_ports = get_current_ports_set()
+    after_unplug_ports = None
+    # Polling is only cheap with the Linux /dev glob; pyserial scans are too slow to repeat.
+    # With no ports to begin with nothing can disappear, so go straight to the prompt
+    if sys.platform.startswith("linux") and initial_ports:
+        print("   Waiting for the port to disappear (no need to press Enter)...")
+        after_unplug_ports = wait_for_port_removal(initial_ports)
+        _drain_stdin()
+    if after_unplug_ports is None:
+        # Not polling, or nothing disappeared within the timeout; let the user confirm manually
+        input("   Press Enter when unplugged...")
+        after_unplug_ports = get_current_ports_set()
     
     # Calculate difference: ports that were there but are gone now
     removed_ports = initial_ports - after_unplug_ports
@@ -131,7 +220,7 @@ def run_calibration(config):
 
     try:
         # Run command and allow it to take over stdout/stdin for interaction
-        subprocess.run(cmd, check=True)
+        subprocess.run(resolve_cmd(cmd), check=True)
         print("\nCalibration process finished.")
     except subprocess.CalledProcessError as e:
         print(f"\nError: Calibration failed with exit code {e.returncode}")
@@ -168,7 +257,7 @@ def run_teleop(config):
     ]
 
     try:
-        subprocess.run(cmd, check=True)
+        subprocess.run(resolve_cmd(cmd), check=True)
     except subprocess.CalledProcessError as e:
         print(f"\nTeleoperation ended/failed with exit code {e.returncode}")
     except KeyboardInterrupt:
@@ -188,22 +277,14 @@ def run_record(config):
         return
 
     # Check for existing datasets
-    base_cache_dir = os.path.expanduser("~/.cache/huggingface/lerobot/lehungry-robotum/")
-    existing_datasets = []
-    
-    if os.path.exists(base_cache_dir):
-        # List subdirectories
-        for name in os.listdir(base_cache_dir):
-            if os.path.isdir(os.path.join(base_cache_dir, name)):
-                existing_datasets.append(name)
-    existing_datasets.sort()
+    existing_datasets = list_local_datasets()
     
     # Menu for Resume vs New
-    print("Select dataset:")
-    for i, name in enumerate(existing_datasets):
-        print(f"{i+1}. Resume '{name}'")
-    print(f"{len(existing_datasets)+1}. Create NEW dataset")
-    print(f"{len(existing_datasets)+2}. Cancel")
+    menu = ["Select dataset:"]
+    menu.extend(f"{i+1}. Resume '{name}'" for i, name in enumerate(existing_datasets))
+    menu.append(f"{len(existing_datasets)+1}. Create NEW dataset")
+    menu.append(f"{len(existing_datasets)+2}. Cancel")
+    sys.stdout.write("\n".join(menu) + "\n")
 
     dataset_name = ""
     resume_flag = "false"
@@ -243,11 +324,13 @@ def run_record(config):
         
     repo_id = f"lehungry-robotum/{dataset_name}"
     
-    print("\n-------------------------------------------")
-    print(f"Repo ID: {repo_id}")
-    print(f"Task:    {task_desc}")
-    print(f"Resume:  {resume_flag}")
-    print("-------------------------------------------")
+    sys.stdout.write(
+        "\n-------------------------------------------\n"
+        f"Repo ID: {repo_id}\n"
+        f"Task:    {task_desc}\n"
+        f"Resume:  {resume_flag}\n"
+        "-------------------------------------------\n"
+    )
     
     input("Press Enter to START recording (Ctrl+C to stop)...")
     
@@ -268,10 +351,14 @@ def run_record(config):
     ]
     
     try:
-        subprocess.run(cmd, check=True)
+        subprocess.run(resolve_cmd(cmd), check=True)
 
         if resume_flag == "false":
             try:
+                # Imported here so the rest of the menu starts without paying for them
+                import lerobot
+                from huggingface_hub import HfApi
+
                 # Use the actual lerobot version
                 version = f"v{lerobot.__version__}"
                 repo_type = "dataset"
@@ -291,22 +378,29 @@ def run_record(config):
 
 def main_menu():
     config = load_config()
+
+    missing = [name for name, path in TOOLS.items() if path is None]
+    if missing:
+        print(f"Warning: not found in PATH: {', '.join(missing)}")
     
     while True:
-        print("\n==============================")
-        print("   LE ROBOT CLI COMMANDER")
-        print("==============================")
         l_port = config.get("leader_port", "Not Set")
         f_port = config.get("follower_port", "Not Set")
         
-        print(f"Leader Port:   {l_port}")
-        print(f"Follower Port: {f_port}")
-        print("------------------------------")
-        print("1. Find Port")
-        print("2. Calibrate Robot")
-        print("3. Teleoperate")
-        print("4. Record Dataset")
-        print("q. Quit")
+        # Emit the whole menu in one write; noticeably snappier over SSH
+        sys.stdout.write(
+            "\n==============================\n"
+            "   LE ROBOT CLI COMMANDER\n"
+            "==============================\n"
+            f"Leader Port:   {l_port}\n"
+            f"Follower Port: {f_port}\n"
+            "------------------------------\n"
+            "1. Find Port\n"
+            "2. Calibrate Robot\n"
+            "3. Teleoperate\n"
+            "4. Record Dataset\n"
+            "q. Quit\n"
+        )
         
         choice = input("\nSelect an option: ").strip().lower()
 
@@ -1,8 +1,26 @@
 import os
-from datasets import load_dataset, Dataset, concatenate_datasets
+import re
+import sys
+import json
+import hashlib
+import shutil
+import threading
+import importlib.util
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from datasets import load_dataset, Dataset, Value, concatenate_datasets
 from dotenv import load_dotenv
+import httpx
 from openai import OpenAI
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Secure configuration loading
 # We explicitly load from .secrets to avoid confusion with other env files
 SECRETS_FILE = ".secrets"
@@ -18,8 +36,15 @@ load_dotenv(dotenv_path=SECRETS_FILE, override=True)
 # Configuration
 REPO_ID = "lehungry-robotum/sebas_test" # Default/Fallback
 TASK_COLUMN = "single_task"                      # The column to augment
+DATASETS_CACHE_DIR = os.path.expanduser("~/.cache/huggingface/lerobot/lehungry-robotum/")
+OUTPUT_DIR = "augmented"                         # Local copy of the generated datasets
+ROWS_PER_WRITE = 1000                            # Rows expanded and written per step
+MAX_SHARD_BYTES = 500 << 20                      # Start a new Parquet shard past this size
 HF_TOKEN = os.environ.get("HF_TOKEN")
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
+OPENAI_MODEL = "gpt-3.5-turbo"
+TASKS_PER_REQUEST = 16                           # Tasks paraphrased per API call
+RESPONSE_CACHE_FILE = ".aug_cache.json"          # Variations from previous runs
 
 if not OPENAI_API_KEY or "ENTER_KEY" in OPENAI_API_KEY:
     print(f"\n[!] CRITICAL ERROR: OPENAI_API_KEY is missing or invalid in '{SECRETS_FILE}'.")
@@ -30,12 +55,87 @@ if not HF_TOKEN or "ENTER_KEY" in HF_TOKEN:
     print("    Pushing to the hub might fail.")
 
 # Initialize OpenAI client
-client = OpenAI(api_key=OPENAI_API_KEY)
+# One pooled connection set shared by the concurrent augmentation requests;
+# HTTP/2 multiplexes them over a single connection when the h2 package is installed
+http_client = httpx.Client(
+    http2=importlib.util.find_spec("h2") is not None,
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    timeout=30.0,
+)
+client = OpenAI(api_key=OPENAI_API_KEY, http_client=http_client)
+
+# One list item per line: "- foo", "* foo", "• foo", "1. foo" or "1) foo"
+_BULLET_RE = re.compile(r'^\s*(?:[-*\u2022]|\d+[.)])\s*(.+?)\s*$', re.M)
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def _json_dumps(obj) -> bytes:
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+def _load_response_cache():
+    if os.path.exists(RESPONSE_CACHE_FILE):
+        try:
+            with open(RESPONSE_CACHE_FILE, 'rb') as f:
+                return _json_loads(f.read())
+        except json.JSONDecodeError:
+            return {}
+    return {}
+
+# On-disk cache of generated variations, so reruns don't pay for the same tasks again
+_RESPONSE_CACHE = _load_response_cache()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_DIRTY = False
+
+def _cache_key(task: str, num_augs: int) -> str:
+    return hashlib.sha1(f"{OPENAI_MODEL}|{num_augs}|{task}".encode()).hexdigest()
+
+def _cache_get(task: str, num_augs: int):
+    with _RESPONSE_CACHE_LOCK:
+        return _RESPONSE_CACHE.get(_cache_key(task, num_augs))
+
+def _cache_put(results: dict[str, list[str]], num_augs: int):
+    """
+    Stores successful generations in memory; flush_response_cache() writes them out.
+    """
+    global _RESPONSE_CACHE_DIRTY
+    with _RESPONSE_CACHE_LOCK:
+        for task, variations in results.items():
+            if variations:
+                _RESPONSE_CACHE[_cache_key(task, num_augs)] = variations
+                _RESPONSE_CACHE_DIRTY = True
+
+def _cache_drop(task: str, num_augs: int):
+    global _RESPONSE_CACHE_DIRTY
+    with _RESPONSE_CACHE_LOCK:
+        if _RESPONSE_CACHE.pop(_cache_key(task, num_augs), None) is not None:
+            _RESPONSE_CACHE_DIRTY = True
+
+def flush_response_cache():
+    """
+    Writes the cache file if anything changed since the last flush.
+    """
+    global _RESPONSE_CACHE_DIRTY
+    with _RESPONSE_CACHE_LOCK:
+        if not _RESPONSE_CACHE_DIRTY:
+            return
+        data = _json_dumps(_RESPONSE_CACHE)
+        tmp_path = f"{RESPONSE_CACHE_FILE}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, RESPONSE_CACHE_FILE)
+        _RESPONSE_CACHE_DIRTY = False
 
-def generate_augmented_tasks(original_task: str, num_augs: int = 3) -> list[str]:
+def generate_augmented_tasks(original_task: str, num_augs: int = 3, use_cache: bool = True) -> list[str]:
     """
     Uses OpenAI API to generate synonymous task strings.
+    Previously generated variations are returned from the on-disk cache unless use_cache is False.
     """
+    if use_cache:
+        cached = _cache_get(original_task, num_augs)
+        if cached is not None:
+            return cached
+
     if not OPENAI_API_KEY:
         print("Warning: OPENAI_API_KEY not found. Returning empty list.")
         return []
@@ -48,7 +148,7 @@ def generate_augmented_tasks(original_task: str, num_augs: int = 3) -> list[str]
 
     try:
         response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
+            model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": "You are a helpful assistant that paraphrases robot commands."},
                 {"role": "user", "content": prompt}
@@ -57,14 +157,79 @@ def generate_augmented_tasks(original_task: str, num_augs: int = 3) -> list[str]
         )
         
         content = response.choices[0].message.content
-        # robust parsing of the bulleted list
-        variations = [line.strip().lstrip('- ').strip() for line in content.split('\n') if line.strip()]
-        return variations[:num_augs]
+        # robust parsing of the bulleted list; fall back to plain lines if there are no bullets
+        variations = _BULLET_RE.findall(content) or [line.strip() for line in content.split('\n') if line.strip()]
+        variations = variations[:num_augs]
+        _cache_put({original_task: variations}, num_augs)
+        return variations
 
     except Exception as e:
         print(f"Error generating augmentation for '{original_task}': {e}")
         return []
 
+def generate_augmented_tasks_batch(tasks: list[str], num_augs: int = 3) -> dict[str, list[str]]:
+    """
+    Uses a single OpenAI request to generate synonymous task strings for several tasks.
+    Cached tasks are not sent, and tasks missing from the response fall back to one request each.
+    """
+    cached = {task: _cache_get(task, num_augs) for task in tasks}
+    results = {task: variations for task, variations in cached.items() if variations is not None}
+    tasks = [task for task in tasks if task not in results]
+
+    if not tasks:
+        return results
+    if len(tasks) == 1:
+        results[tasks[0]] = generate_augmented_tasks(tasks[0], num_augs)
+        return results
+
+    numbered = "\n".join(f"{i}: {task}" for i, task in enumerate(tasks))
+    prompt = (
+        f"Generate {num_augs} distinct, natural language variations for each of the following numbered robot tasks.\n"
+        "The variations should convey the exact same meaning but use different words or phrasing suitable for a robot instruction.\n"
+        'Return ONLY a JSON object mapping each task number to its list of variations, e.g. {"0": ["...", "..."], "1": [...]}.\n\n'
+        f"{numbered}"
+    )
+
+    try:
+        response = client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": "You are a helpful assistant that paraphrases robot commands."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7,
+            response_format={"type": "json_object"},
+        )
+
+        parsed = _json_loads(response.choices[0].message.content)
+        generated = {}
+        for i, task in enumerate(tasks):
+            variations = parsed.get(str(i))
+            if isinstance(variations, list):
+                generated[task] = [str(v).strip() for v in variations if str(v).strip()][:num_augs]
+        _cache_put(generated, num_augs)
+        results.update(generated)
+
+    except Exception as e:
+        print(f"Error generating batched augmentations for {len(tasks)} tasks: {e}")
+
+    for task in tasks:
+        if task not in results:
+            results[task] = generate_augmented_tasks(task, num_augs)
+    return results
+
+def _chunked(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def _group_task_ids(mapping):
+    """
+    Maps each distinct task string to the task ids that share it, in mapping order.
+    """
+    groups = {}
+    for task_id, task_str in mapping.items():
+        groups.setdefault(task_str, []).append(task_id)
+    return groups
+
 # Global caches
 TASK_MAPPING = {}
 AUGMENTATION_CACHE = {}
@@ -85,87 +250,169 @@ def load_task_mapping(repo_id):
 
         file_path = hf_hub_download(repo_id=repo_id, filename="meta/tasks.parquet", repo_type="dataset")
         
-        # Load using datasets library
-        ds = load_dataset("parquet", data_files=file_path, split="train")
-        print(f"Tasks metadata columns: {ds.column_names}")
+        # Read the lookup table directly; a full datasets build is overkill here
+        with pq.ParquetFile(file_path) as pf:
+            schema = pf.schema_arrow
+            print(f"Tasks metadata columns: {schema.names}")
         
-        # Assume 'task_index' and 'task' are the columns
-        task_col = "task"
-        if "task" not in ds.column_names:
-            str_cols = [c for c in ds.column_names if isinstance(ds[0][c], str)]
-            if str_cols:
-                task_col = str_cols[0]
+            # Assume 'task_index' and 'task' are the columns
+            task_col = "task"
+            if "task" not in schema.names:
+                str_cols = [f.name for f in schema if pa.types.is_string(f.type) or pa.types.is_large_string(f.type)]
+                if str_cols:
+                    task_col = str_cols[0]
         
-        mapping = {row['task_index']: row[task_col] for row in ds}
+            # Stream one row group at a time so memory stays bounded for large task files
+            mapping = {}
+            for i in range(pf.num_row_groups):
+                group = pf.read_row_group(i, columns=['task_index', task_col])
+                mapping.update(zip(group['task_index'].to_pylist(), group[task_col].to_pylist()))
         print(f"Loaded {len(mapping)} tasks.")
         return mapping
     except Exception as e:
         print(f"Error loading task mapping: {e}")
         return {}
 
-def precompute_augmentations(mapping):
+def precompute_augmentations(mapping, max_workers=8):
     """
     Generates augmentations for all unique tasks in the mapping.
+    Tasks are sent TASKS_PER_REQUEST at a time, and the I/O bound
+    requests are dispatched concurrently.
     """
-    print(f"Pre-computing augmentations for {len(mapping)} unique tasks...")
-    cache = {}
-    for task_id, task_str in mapping.items():
-        print(f"Generating synonyms for task {task_id}: '{task_str}'")
-        variations = generate_augmented_tasks(task_str)
-        # Store original + variations
-        cache[task_id] = [task_str] + variations
-        print(f" -> Generated {len(variations)} variations.")
-    return cache
-
-def augment_batch(batch):
+    # Ids that share a description are only paraphrased once
+    unique_tasks = list(_group_task_ids(mapping))
+    print(f"Pre-computing augmentations for {len(unique_tasks)} unique tasks...")
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(generate_augmented_tasks_batch, chunk)
+            for chunk in _chunked(unique_tasks, TASKS_PER_REQUEST)
+        ]
+        for future in as_completed(futures):
+            for task_str, variations in future.result().items():
+                results[task_str] = variations
+                print(f"'{task_str}' -> Generated {len(variations)} variations.")
+    flush_response_cache()
+
+    # Store original + variations, keeping the mapping's order
+    return {task_id: [task_str] + results[task_str] for task_id, task_str in mapping.items()}
+
+def expand_dataset(dataset):
     """
-    Iterates over the existing batch and creates new rows for each augmented string.
+    Repeats each row once per augmented string and writes the strings into TASK_COLUMN.
+    Yields the expanded rows as Arrow tables of up to ROWS_PER_WRITE rows; each one is
+    gathered from just the source rows it repeats, so only that slice is copied out of the mmap.
     """
-    # Lists to store all new (original + augmented) data for this batch
-    new_columns = list(batch.keys())
-    if TASK_COLUMN not in new_columns:
-        new_columns.append(TASK_COLUMN)
-        
-    new_data = {col: [] for col in new_columns}
-    
-    # Iterate over each example (row) in the batch
-    for i in range(len(batch['task_index'])):
-        task_idx = batch['task_index'][i]
-        
-        # Retrieve pre-computed augmented list (original + synonyms)
-        # Default to just the original ID string if mapping fails (fallback)
-        augmented_tasks = AUGMENTATION_CACHE.get(task_idx, [f"Task {task_idx}"])
-        
-        # Duplicate the physical data for each augmented task string
-        for task_string in augmented_tasks:
-            # Copy all features
-            for col in batch.keys():
-                new_data[col].append(batch[col][i])
-            
-            # Add the text column
-            new_data[TASK_COLUMN].append(task_string)
-    
-    return new_data
+    # load_dataset results have no indices mapping, so the backing (memory-mapped) table is the dataset
+    table = dataset.data.table
+
+    # Retrieve pre-computed augmented list (original + synonyms) for every row.
+    # Task ids are small dense ints, so resolve each id once into a list and index it per row
+    # Default to just the original ID string if mapping fails (fallback)
+    task_ids = table['task_index'].to_pylist()
+    max_id = max(task_ids, default=-1)
+    lookup = [AUGMENTATION_CACHE.get(i, [f"Task {i}"]) for i in range(max_id + 1)]
+    augmented = [lookup[task_idx] for task_idx in task_ids]
+
+    # Duplicate the physical data for each augmented task string.
+    # The take indices are built in one preallocated array rather than a Python list per row
+    counts = np.fromiter((len(tasks) for tasks in augmented), dtype=np.int64, count=len(augmented))
+    indices = np.repeat(np.arange(len(augmented), dtype=np.int64), counts)
+    task_strings = list(chain.from_iterable(augmented))
+
+    # Keep the HF feature metadata (image/video types etc.) in sync with the new column
+    features = dataset.features.copy()
+    features[TASK_COLUMN] = Value("string")
+    metadata = features.arrow_schema.metadata
+    col_idx = table.schema.get_field_index(TASK_COLUMN)
+
+    # An empty split still yields one empty slice, so a schema-only shard gets written
+    for start in range(0, max(len(indices), 1), ROWS_PER_WRITE):
+        end = start + ROWS_PER_WRITE
+        rows = indices[start:end]
+
+        # indices are sorted, so cut out the source rows this slice needs before the take;
+        # a take on the full table gathers across every chunk of the mmap on each step
+        first = int(rows[0]) if len(rows) else 0
+        last = int(rows[-1]) + 1 if len(rows) else 0
+        expanded = table.slice(first, last - first).take(pa.array(rows - first))
+
+        # Replace the text column, keeping its position if it already exists
+        column = pa.array(task_strings[start:end], type=pa.string())
+        if col_idx == -1:
+            expanded = expanded.append_column(TASK_COLUMN, column)
+        else:
+            expanded = expanded.set_column(col_idx, TASK_COLUMN, column)
+        yield expanded.replace_schema_metadata(metadata)
+
+def write_parquet(tables, repo_id: str) -> tuple[str, int]:
+    """
+    Streams the tables into the Hub's data/train-XXXXX-of-YYYYY.parquet layout, starting
+    a new shard every MAX_SHARD_BYTES. Returns the folder to upload and the row count.
+    """
+    folder = os.path.join(OUTPUT_DIR, repo_id.replace("/", "__"))
+    data_dir = os.path.join(folder, "data")
+    # Shards from a previous run would be picked up alongside the new ones
+    shutil.rmtree(data_dir, ignore_errors=True)
+    os.makedirs(data_dir)
+
+    shard_paths = []
+    writer = None
+    shard_bytes = 0
+    num_rows = 0
+    try:
+        for table in tables:
+            if writer is None or shard_bytes >= MAX_SHARD_BYTES:
+                if writer is not None:
+                    writer.close()
+                # Final names need the shard count, so number them once everything is written
+                shard_paths.append(os.path.join(data_dir, f"train-{len(shard_paths):05d}.parquet.tmp"))
+                writer = pq.ParquetWriter(shard_paths[-1], table.schema, compression="zstd")
+                shard_bytes = 0
+            writer.write_table(table, row_group_size=ROWS_PER_WRITE)
+            shard_bytes += table.nbytes
+            num_rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+
+    for i, path in enumerate(shard_paths):
+        os.replace(path, os.path.join(data_dir, f"train-{i:05d}-of-{len(shard_paths):05d}.parquet"))
+
+    # Minimal card pointing at the shards; replaces any card whose dataset_info
+    # (split sizes) would no longer match the uploaded files
+    with open(os.path.join(folder, "README.md"), 'w') as f:
+        f.write(
+            "---\n"
+            "configs:\n"
+            "- config_name: default\n"
+            "  data_files:\n"
+            "  - split: train\n"
+            "    path: data/train-*\n"
+            "---\n"
+        )
+    return folder, num_rows
+
+def list_local_datasets(base_cache_dir=DATASETS_CACHE_DIR):
+    """Returns the sorted names of dataset directories in the local lerobot cache."""
+    try:
+        # scandir entries carry the file type, so no extra stat per name
+        with os.scandir(base_cache_dir) as entries:
+            return sorted(e.name for e in entries if e.is_dir())
+    except FileNotFoundError:
+        return []
 
 def get_target_dataset():
     """
     Interactively select a dataset from local cache or input a custom name.
     """
     # Check for existing datasets in standard HF cache location
-    base_cache_dir = os.path.expanduser("~/.cache/huggingface/lerobot/lehungry-robotum/")
-    existing_datasets = []
+    existing_datasets = list_local_datasets()
     
-    if os.path.exists(base_cache_dir):
-        # List subdirectories
-        for name in os.listdir(base_cache_dir):
-            if os.path.isdir(os.path.join(base_cache_dir, name)):
-                existing_datasets.append(name)
-    existing_datasets.sort()
-    
-    print("\n--- Select Dataset to Augment ---")
-    for i, name in enumerate(existing_datasets):
-        print(f"{i+1}. lehungry-robotum/{name}")
-    print(f"{len(existing_datasets)+1}. Enter custom Repo ID")
+    menu = ["\n--- Select Dataset to Augment ---"]
+    menu.extend(f"{i+1}. lehungry-robotum/{name}" for i, name in enumerate(existing_datasets))
+    menu.append(f"{len(existing_datasets)+1}. Enter custom Repo ID")
+    sys.stdout.write("\n".join(menu) + "\n")
     
     repo_id = ""
     while True:
@@ -187,38 +434,60 @@ def get_target_dataset():
             
     return repo_id
 
-def review_augmentations(mapping):
+def review_augmentations(mapping, num_augs=3):
     """
     Interactively generates and reviews augmentations for each task.
+    Variations are fetched TASKS_PER_REQUEST tasks at a time, and the next
+    chunk is fetched in the background while the current one is being reviewed.
     """
-    print(f"\n--- Review Augmentations ({len(mapping)} unique tasks) ---")
-    cache = {}
-    
-    for task_id, task_str in mapping.items():
-        print(f"\nTask [{task_id}]: '{task_str}'")
-        
-        while True:
+    groups = _group_task_ids(mapping)
+    print(f"\n--- Review Augmentations ({len(groups)} unique tasks) ---")
+    accepted = {}
+    # Ids that share a description are reviewed (and paraphrased) once
+    chunks = _chunked(list(groups.items()), TASKS_PER_REQUEST)
+
+    def fetch(chunk):
+        return generate_augmented_tasks_batch([task_str for task_str, _ in chunk], num_augs)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(fetch, chunks[0]) if chunks else None
+
+        for pos, chunk in enumerate(chunks):
             print("Generating variations...")
-            variations = generate_augmented_tasks(task_str)
-            
-            print("\nProposed variations:")
-            for v in variations:
-                print(f" - {v}")
-            
-            choice = input("\nAccept these variations? [y]/n/r (retry): ").strip().lower()
-            
-            if choice == 'r':
-                continue # Retry loop
-            elif choice == 'n':
-                print("Skipping variations for this task (using original only).")
-                cache[task_id] = [task_str]
-                break
-            else:
-                # Default to yes
-                cache[task_id] = [task_str] + variations
-                break
-                
-    return cache
+            prefetched = pending.result()
+            # Start on the next chunk while the user reviews this one
+            pending = executor.submit(fetch, chunks[pos + 1]) if pos + 1 < len(chunks) else None
+
+            for task_str, task_ids in chunk:
+                print(f"\nTask [{', '.join(str(t) for t in task_ids)}]: '{task_str}'")
+                variations = prefetched[task_str]
+
+                while True:
+                    print("\nProposed variations:")
+                    for v in variations:
+                        print(f" - {v}")
+
+                    choice = input("\nAccept these variations? [y]/n/r (retry): ").strip().lower()
+
+                    if choice == 'r':
+                        print("Generating variations...")
+                        variations = generate_augmented_tasks(task_str, num_augs, use_cache=False)
+                        continue # Retry loop
+                    elif choice == 'n':
+                        print("Skipping variations for this task (using original only).")
+                        # Don't offer the rejected variations again on the next run
+                        _cache_drop(task_str, num_augs)
+                        accepted[task_str] = [task_str]
+                        break
+                    else:
+                        # Default to yes
+                        accepted[task_str] = [task_str] + variations
+                        break
+
+            # Save progress once per reviewed chunk
+            flush_response_cache()
+
+    return {task_id: accepted[task_str] for task_id, task_str in mapping.items()}
 
 def main():
     global TASK_MAPPING, AUGMENTATION_CACHE, REPO_ID
@@ -229,8 +498,8 @@ def main():
 
     print(f"Loading dataset...")
     try:
-        # Load the dataset
-        dataset = load_dataset(REPO_ID, split='train') 
+        # Load the dataset, preparing shards on half the cores
+        dataset = load_dataset(REPO_ID, split='train', num_proc=max(1, (os.cpu_count() or 1) // 2))
     except Exception as e:
         print(f"Error loading dataset: {e}")
         return
@@ -252,31 +521,34 @@ def main():
 
     print("Starting augmentation...")
     
-    # Apply the augmentation across the entire dataset
-    augmented_dataset = dataset.map(
-        augment_batch, 
-        batched=True, 
-        batch_size=1000, 
-        remove_columns=dataset.column_names 
-    )
+    # Apply the augmentation across the entire dataset, writing it out as it is generated
+    target_repo_id = f"{REPO_ID}-augmented"
+    output_folder, augmented_rows = write_parquet(expand_dataset(dataset), target_repo_id)
 
     print(f"Original size: {len(dataset)} episodes")
-    print(f"Augmented size: {len(augmented_dataset)} episodes")
+    print(f"Augmented size: {augmented_rows} episodes")
 
     # 5. Push to Hub
-    target_repo_id = f"{REPO_ID}-augmented"
-    print(f"\nTarget Repo ID: {target_repo_id}")
+    print(f"\nSaved locally to: {output_folder}")
+    print(f"Target Repo ID: {target_repo_id}")
     
     if input("Push to Hugging Face Hub? [y]/n: ").strip().lower() == 'n':
-        print("Skipping upload. You can save locally or run again to push.")
+        print("Skipping upload. Run again to push.")
         return
 
     print(f"Pushing to Hub...")
     try:
-        augmented_dataset.push_to_hub(
-            repo_id=target_repo_id, 
-            split='train',
-            token=HF_TOKEN or "<YOUR_HF_WRITE_TOKEN>"
+        from huggingface_hub import HfApi
+
+        token = HF_TOKEN or "<YOUR_HF_WRITE_TOKEN>"
+        hub_api = HfApi(token=token)
+        hub_api.create_repo(repo_id=target_repo_id, repo_type="dataset", exist_ok=True)
+        hub_api.upload_folder(
+            folder_path=output_folder,
+            repo_id=target_repo_id,
+            repo_type="dataset",
+            # Replace shards from earlier pushes instead of adding to them
+            delete_patterns=["data/*"],
         )
         print("Successfully pushed to Hub.")
     except Exception as e: